@@ -1,3 +1,5 @@
 """mm-jinja: Jinja2 environment with useful filters and globals."""
 
+from mm_jinja.globals import TemplateRuntimeError as TemplateRuntimeError
+from mm_jinja.globals import cached_utc as cached_utc
 from mm_jinja.jinja import init_jinja as init_jinja
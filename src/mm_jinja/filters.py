@@ -1,14 +1,20 @@
 """Jinja2 filter functions for common template formatting operations."""
 
+import itertools
 import json
-from collections.abc import Sequence
+import time
+from collections.abc import Callable, Sequence
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
 
 from markupsafe import Markup
 
+DEFAULT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def timestamp(value: datetime | int | None, format_: str = "%Y-%m-%d %H:%M:%S") -> str:
+
+def timestamp(value: datetime | int | None, format_: str = DEFAULT_TIMESTAMP_FORMAT) -> str:
     """Format a datetime or unix timestamp to a string.
 
     Args:
@@ -18,28 +24,48 @@ def timestamp(value: datetime | int | None, format_: str = "%Y-%m-%d %H:%M:%S")
     Returns:
         Formatted date string, or empty string if value is None.
 
+    Note:
+        The default format is assembled without strftime (isoformat for datetimes, local time fields for timestamps).
+        Unlike strftime's %Y, it always pads the year to four digits (year 5 renders as "0005").
+
     """
-    if isinstance(value, datetime):
-        return value.strftime(format_)
     if isinstance(value, int):
+        if format_ == DEFAULT_TIMESTAMP_FORMAT:
+            # Local time fields directly, without building a datetime
+            tm = time.localtime(value)
+            return f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d} {tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
         # Naive datetime intentional - this is for simple display formatting
-        return datetime.fromtimestamp(value).strftime(format_)  # noqa: DTZ006
+        value = datetime.fromtimestamp(value)  # noqa: DTZ006
+    if isinstance(value, datetime):
+        if format_ == DEFAULT_TIMESTAMP_FORMAT:
+            return value.replace(tzinfo=None).isoformat(" ", "seconds")
+        return value.strftime(format_)
     return ""
 
 
+# Builtin containers checked by exact type, so the common cases skip the Sequence ABC isinstance check
+_EMPTY_CONTAINER_TYPES = frozenset({str, list, tuple, bytes, bytearray, dict, set, frozenset})
+
+
 def empty(value: object) -> object:
-    """Return empty string for None or empty sequences, otherwise return value unchanged."""
+    """Return empty string for None or empty sequences/containers, otherwise return value unchanged."""
     if value is None:
         return ""
+    if type(value) in _EMPTY_CONTAINER_TYPES:
+        return value or ""
     if isinstance(value, Sequence) and len(value) == 0:
         return ""
     return value
 
 
-def yes_no(
-    value: object, is_colored: bool = True, hide_no: bool = False, none_is_false: bool = False, on_off: bool = False
-) -> Markup:
-    """Format a boolean value as colored yes/no (or on/off) HTML span."""
+_SPAN_PREFIX = {clr: f"<span style='color: {clr};'>" for clr in ("black", "green", "red")}
+_SPAN_SUFFIX = "</span>"
+# Only for spans built from the fixed labels in _render_yes_no: skips Markup's __html__ check in __new__
+_new_markup = str.__new__
+
+
+def _render_yes_no(value: object, is_colored: bool, hide_no: bool, none_is_false: bool, on_off: bool) -> Markup:
+    """Build the yes_no HTML span for a boolean/None value; fills _YES_NO_CACHE and handles non-bool flags."""
     clr = "black"
     if none_is_false and value is None:
         value = False
@@ -55,7 +81,32 @@ def yes_no(
     if not is_colored:
         clr = "black"
     # HTML constructed from controlled internal values, not user input
-    return Markup(f"<span style='color: {clr};'>{value}</span>")  # nosec  # noqa: S704
+    return _new_markup(Markup, _SPAN_PREFIX[clr] + str(value) + _SPAN_SUFFIX)
+
+
+# Every (True/False/None, flags) combination rendered once at import; yes_no serves these from a dict lookup.
+_YES_NO_CACHE: dict[tuple[object, bool, bool, bool, bool], Markup] = {
+    (value, is_colored, hide_no, none_is_false, on_off): _render_yes_no(value, is_colored, hide_no, none_is_false, on_off)
+    for value, is_colored, hide_no, none_is_false, on_off in itertools.product(
+        (True, False, None), (True, False), (True, False), (True, False), (True, False)
+    )
+}
+
+
+def yes_no(
+    value: object, is_colored: bool = True, hide_no: bool = False, none_is_false: bool = False, on_off: bool = False
+) -> Markup:
+    """Format a boolean value as colored yes/no (or on/off) HTML span."""
+    # Identity check first: 1 == True and 0 == False, so other values must not reach the cache
+    if value is True or value is False or value is None:
+        cached = _YES_NO_CACHE.get((value, is_colored, hide_no, none_is_false, on_off))
+        # Miss only for non-bool flags (e.g. strings passed from a template)
+        return cached if cached is not None else _render_yes_no(value, is_colored, hide_no, none_is_false, on_off)
+    # Any other value is shown as-is in black, whatever the flags
+    return Markup(_SPAN_PREFIX["black"] + str(value) + _SPAN_SUFFIX)  # nosec  # noqa: S704
+
+
+_FIXED_FORMAT_SPECS = {i: f".{i}f" for i in range(8)}
 
 
 def nformat(
@@ -81,10 +132,11 @@ def nformat(
 
     Note:
         For values > 1000, decimals are truncated and separator is applied.
-        For values <= 1000, decimal rounding is applied without separator.
+        For values <= 1000, the value is rounded to exactly `digits` decimal places without separator.
+        A negative `digits` rounds to the left of the decimal point, as with round().
 
     """
-    if value is None or value == "":
+    if value is None or (isinstance(value, str) and not value):
         return ""
 
     num = float(value)
@@ -95,11 +147,14 @@ def nformat(
         return f"{prefix}0{suffix}"
 
     if num > 1000:
-        formatted = "".join(
-            reversed([x + (separator if i and not i % 3 else "") for i, x in enumerate(reversed(str(int(num))))]),
-        )
+        formatted = format(int(num), ",")
+        if separator != ",":
+            formatted = formatted.replace(",", separator)
+    elif digits < 0:
+        # Format specs have no negative precision; round to tens/hundreds/... first
+        formatted = format(round(num, digits), ".0f")
     else:
-        formatted = str(round(num, digits))
+        formatted = format(num, _FIXED_FORMAT_SPECS.get(digits) or f".{digits}f")
 
     return f"{prefix}{formatted}{suffix}"
 
@@ -109,12 +164,14 @@ def to_json(data: dict[str, object]) -> str:
     return json.dumps(data)
 
 
-MM_JINJA_FILTERS = {
-    "timestamp": timestamp,
-    "dt": timestamp,
-    "empty": empty,
-    "yes_no": yes_no,
-    "nformat": nformat,
-    "n": nformat,
-    "to_json": to_json,
-}
+MM_JINJA_FILTERS: MappingProxyType[str, Callable[..., Any]] = MappingProxyType(
+    {
+        "timestamp": timestamp,
+        "dt": timestamp,
+        "empty": empty,
+        "yes_no": yes_no,
+        "nformat": nformat,
+        "n": nformat,
+        "to_json": to_json,
+    }
+)
@@ -1,20 +1,50 @@
 """Jinja2 global functions available in all templates."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any, NoReturn
 
+# Value returned by utc() inside a cached_utc() block; None outside, where utc() always reads the clock
+_cached_utc: ContextVar[datetime | None] = ContextVar("mm_jinja_cached_utc", default=None)
+
+
+@contextmanager
+def cached_utc() -> Iterator[datetime]:
+    """Make utc() return one fixed datetime for the duration of the block.
+
+    Intended to wrap a single request or render. On exit the previous state is restored,
+    so code outside the block gets fresh values again.
+    """
+    now = datetime.now(UTC)
+    token = _cached_utc.set(now)
+    try:
+        yield now
+    finally:
+        _cached_utc.reset(token)
+
 
 def utc() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(UTC)
+    """Return the current UTC datetime, or the fixed one inside a cached_utc() block."""
+    return _cached_utc.get() or datetime.now(UTC)
+
+
+class TemplateRuntimeError(RuntimeError):
+    """Error raised from a template via the raise() global."""
+
+    __slots__ = ()
 
 
 def raise_(msg: str) -> NoReturn:
-    """Raise a RuntimeError from within a Jinja2 template."""
-    raise RuntimeError(msg)
+    """Raise a TemplateRuntimeError from within a Jinja2 template."""
+    raise TemplateRuntimeError(msg)
 
 
-MM_JINJA_GLOBALS: dict[str, Any] = {
-    "raise": raise_,
-    "utc": utc,
-}
+MM_JINJA_GLOBALS: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        "raise": raise_,
+        "utc": utc,
+    }
+)
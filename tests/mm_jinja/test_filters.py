@@ -19,6 +19,14 @@ class TestEmptyFilter:
         assert empty([]) == ""
         assert empty(0) == 0
 
+    def test_empty_containers(self) -> None:
+        """Empty dicts, sets and other sequences also return empty string."""
+        assert empty({}) == ""
+        assert empty(set()) == ""
+        assert empty(range(0)) == ""
+        assert empty({"a": 1}) == {"a": 1}
+        assert empty([0]) == [0]
+
 
 class TestTimestampFilter:
     """Tests for the timestamp filter function."""
@@ -28,17 +36,36 @@ class TestTimestampFilter:
         dt = datetime(2024, 1, 15, 10, 30, 45, tzinfo=UTC)
         assert timestamp(dt) == "2024-01-15 10:30:45"
 
+    def test_datetime_default_format_drops_microseconds(self) -> None:
+        """Default format truncates microseconds."""
+        dt = datetime(2024, 1, 15, 10, 30, 45, 999999, tzinfo=UTC)
+        assert timestamp(dt) == "2024-01-15 10:30:45"
+
+    def test_datetime_default_format_pads_year(self) -> None:
+        """Default format pads years before 1000 to four digits."""
+        assert timestamp(datetime(5, 1, 1, tzinfo=UTC)) == "0005-01-01 00:00:00"
+
     def test_datetime_custom_format(self) -> None:
         """Datetime with custom format."""
         dt = datetime(2024, 1, 15, 10, 30, 45, tzinfo=UTC)
         assert timestamp(dt, "%Y-%m-%d") == "2024-01-15"
         assert timestamp(dt, "%H:%M") == "10:30"
 
+    def test_empty_format(self) -> None:
+        """Empty format string returns empty string."""
+        dt = datetime(2024, 1, 15, 10, 30, 45, tzinfo=UTC)
+        assert timestamp(dt, "") == ""
+        assert timestamp(0, "") == ""
+
     def test_unix_timestamp(self) -> None:
         """Unix timestamp integer input."""
         result = timestamp(0, "%Y-%m-%d")
         assert "1970" in result
 
+    def test_unix_timestamp_default_format(self) -> None:
+        """Unix timestamp with default format matches local-time strftime."""
+        assert timestamp(1705314645) == datetime.fromtimestamp(1705314645).strftime("%Y-%m-%d %H:%M:%S")  # noqa: DTZ006
+
     def test_none_returns_empty(self) -> None:
         """None input returns empty string."""
         assert timestamp(None) == ""
@@ -88,6 +115,17 @@ class TestYesNoFilter:
         assert "black" in yes_no(True, is_colored=False)
         assert "black" in yes_no(False, is_colored=False)
 
+    def test_non_bool_flags(self) -> None:
+        """Truthy non-bool flags behave like True."""
+        assert yes_no(False, hide_no="yes") == yes_no(False, hide_no=True)
+
+    def test_non_boolean_value(self) -> None:
+        """Truthy/falsy non-booleans are rendered as-is, not confused with True/False."""
+        assert isinstance(yes_no(1), Markup)
+        assert yes_no(1) == Markup("<span style='color: black;'>1</span>")
+        assert yes_no(0) == Markup("<span style='color: black;'>0</span>")
+        assert yes_no("maybe", hide_no=True, on_off=True) == Markup("<span style='color: black;'>maybe</span>")
+
 
 class TestNformatFilter:
     """Tests for the nformat filter function."""
@@ -112,14 +150,21 @@ class TestNformatFilter:
         assert nformat(0.0, hide_zero=True) == ""
 
     def test_small_number_rounding(self) -> None:
-        """Numbers <= 1000 are rounded to specified digits."""
+        """Numbers <= 1000 are rounded and padded to specified digits."""
         assert nformat(123.456, digits=2) == "123.46"
         assert nformat(123.456, digits=1) == "123.5"
-        assert nformat(123.456, digits=0) == "123.0"
+        assert nformat(123.456, digits=0) == "123"
+        assert nformat(1.5, digits=3) == "1.500"
+        assert nformat(0.123456789, digits=9) == "0.123456789"
+
+    def test_small_number_negative_digits(self) -> None:
+        """Negative digits round to tens/hundreds like round()."""
+        assert nformat(123, digits=-1) == "120"
+        assert nformat(456.7, digits=-2) == "500"
 
     def test_small_number_string_input(self) -> None:
         """String input works for numbers <= 1000."""
-        assert nformat("500.50", digits=2) == "500.5"
+        assert nformat("500.50", digits=2) == "500.50"
         assert nformat("123.456", digits=1) == "123.5"
 
     def test_large_number_separator(self) -> None:
@@ -133,11 +178,15 @@ class TestNformatFilter:
         assert nformat("1234", separator=",") == "1,234"
         assert nformat("1234567", separator=" ") == "1 234 567"
 
+    def test_large_number_no_separator(self) -> None:
+        """Empty separator leaves digits ungrouped."""
+        assert nformat(1234567) == "1234567"
+
     def test_prefix_suffix(self) -> None:
         """Prefix and suffix are applied correctly."""
-        assert nformat(100, prefix="$") == "$100.0"
-        assert nformat(100, suffix=" USD") == "100.0 USD"
-        assert nformat(100, prefix="$", suffix=" USD") == "$100.0 USD"
+        assert nformat(100, prefix="$") == "$100.00"
+        assert nformat(100, suffix=" USD") == "100.00 USD"
+        assert nformat(100, prefix="$", suffix=" USD") == "$100.00 USD"
 
     def test_decimal_input(self) -> None:
         """Decimal input works correctly."""
@@ -148,7 +197,7 @@ class TestNformatFilter:
         [
             (999.99, "999.99"),
             (1000.01, "1,000"),
-            (1000, "1000.0"),  # 1000 is not > 1000, goes to else branch
+            (1000, "1000.00"),  # 1000 is not > 1000, goes to else branch
             (1001, "1,001"),
         ],
     )
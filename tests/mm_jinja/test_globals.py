@@ -0,0 +1,49 @@
+"""Tests for mm_jinja.globals module."""
+
+from datetime import UTC
+
+import pytest
+
+from mm_jinja.globals import TemplateRuntimeError, cached_utc, raise_, utc
+
+
+class TestUtcGlobal:
+    """Tests for the utc global function."""
+
+    def test_returns_aware_utc(self) -> None:
+        """Returned datetime is timezone-aware UTC."""
+        assert utc().tzinfo is UTC
+
+    def test_not_cached_by_default(self) -> None:
+        """Outside cached_utc, every call reads the clock."""
+        assert utc() is not utc()
+
+    def test_cached_inside_block(self) -> None:
+        """Inside cached_utc, calls return the datetime taken on entry."""
+        with cached_utc() as now:
+            assert utc() is now
+            assert utc() is now
+
+    def test_fresh_after_block(self) -> None:
+        """Leaving cached_utc restores fresh values."""
+        with cached_utc() as now:
+            pass
+        assert utc() is not now
+        assert utc() >= now
+
+    def test_nested_blocks(self) -> None:
+        """An inner block overrides the outer one and restores it on exit."""
+        with cached_utc() as outer:
+            with cached_utc() as inner:
+                assert utc() is inner
+            assert utc() is outer
+
+
+class TestRaiseGlobal:
+    """Tests for the raise global function."""
+
+    def test_raises_template_runtime_error(self) -> None:
+        """raise_ raises TemplateRuntimeError, still catchable as RuntimeError."""
+        with pytest.raises(TemplateRuntimeError, match="boom"):
+            raise_("boom")
+        assert issubclass(TemplateRuntimeError, RuntimeError)